@@ -1,40 +1,165 @@
 import os
-from flask import Flask, render_template
+import sys
+import logging
+import importlib
+from flask import Flask, render_template, redirect, url_for, g, request
 from flask_wtf.csrf import CSRFProtect
+from flask_caching import Cache
 
-from tools.neighbor_letters.routes import neighbor_letters
-from tools.qr_labels.routes import qr_labels_bp
+if __name__ == "__main__":
+    # Load .env before config reads the environment at import
+    from dotenv import load_dotenv
+    load_dotenv()
+
+from config import config
+from utils.json_provider import OrjsonProvider
+
+def _config_dict(config_class):
+    """Collect a config class's uppercase settings, as from_object would."""
+    return {key: getattr(config_class, key) for key in dir(config_class) if key.isupper()}
+
+# The environment cannot change within a process, so resolve it once.
+# Without FLASK_ENV the app runs with production settings, never in debug.
+_CONFIG = _config_dict(config.get(os.getenv('FLASK_ENV'), config['production']))
+
+# Project root, computed once so Flask does not have to locate it per app
+_ROOT = os.path.dirname(os.path.abspath(__file__))
+
+cache = Cache()
+csrf = CSRFProtect()
+
+# Tool blueprints by name: (module path, blueprint attribute, url prefix)
+BLUEPRINTS = {
+    'neighbor_letters': ('tools.neighbor_letters.routes', 'neighbor_letters', None),
+    'qr_labels': ('tools.qr_labels.routes', 'qr_labels_bp', '/qr-labels'),
+}
+
+def _log_profile(app, heading, profiler):
+    """Log a stopped pyinstrument profile through app.logger."""
+    # Profiling is opt-in, so do not let the default WARNING level hide it
+    if not app.logger.isEnabledFor(logging.INFO):
+        app.logger.setLevel(logging.INFO)
+    app.logger.info("%s:\n%s", heading, profiler.output_text(unicode=True))
+
+def _init_request_profiler(app):
+    """Log a pyinstrument profile of every request (PROFILE_REQUESTS)."""
+    from pyinstrument import Profiler
+
+    @app.before_request
+    def start_profiler():
+        g.profiler = Profiler()
+        g.profiler.start()
+
+    @app.after_request
+    def stop_profiler(response):
+        profiler = g.pop('profiler', None)
+        if profiler:
+            profiler.stop()
+            _log_profile(app, f"Profile of {request.method} {request.path}", profiler)
+        return response
+
+def create_app(config_override=None, blueprints=tuple(BLUEPRINTS), minimal=False):
+    # Set PROFILE_STARTUP to log where the time building the app goes
+    profiler = None
+    if os.getenv('PROFILE_STARTUP'):
+        from pyinstrument import Profiler
+        profiler = Profiler()
+        profiler.start()
+
+    # A minimal app registers no tool blueprints, for checks that only need
+    # the app to build and answer /healthz
+    if minimal:
+        blueprints = ()
+    for name in blueprints:
+        if name not in BLUEPRINTS:
+            raise ValueError(f"Unknown blueprint {name!r}; expected one of {', '.join(sorted(BLUEPRINTS))}")
 
-def create_app(config_override=None):
-    app = Flask(__name__)
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev_key')
+    app = Flask(__name__, root_path=_ROOT)
+    app.json = OrjsonProvider(app)
+    app.config.update(_CONFIG)
+    for name in BLUEPRINTS:
+        app.config[f'ENABLE_{name.upper()}'] = name in blueprints
 
     # If no DATA_FOLDER is set, default to "data" in the project
     if 'DATA_FOLDER' not in app.config:
         app.config['DATA_FOLDER'] = os.path.join(os.getcwd(), "data")
-    
+
     if config_override:
         app.config.update(config_override)
-    
-    csrf = CSRFProtect()
-    csrf.init_app(app)
 
-    # Register neighbor letters blueprint
-    app.register_blueprint(neighbor_letters)
-    # Register QR labels blueprint
-    app.register_blueprint(qr_labels_bp, url_prefix='/qr-labels')
+    # CSRF protection is on by default; test runs and API-only deployments
+    # can turn it off with ENABLE_CSRF and skip its per-request hook.
+    if app.config.get('ENABLE_CSRF', not app.config['TESTING']):
+        csrf.init_app(app)
+    else:
+        app.jinja_env.globals['csrf_token'] = lambda: ''
+
+    cache.init_app(app)
+
+    # Tool blueprints are imported here rather than at module level so a
+    # process only loads the PDF/QR/API dependencies of the tools it serves.
+    for name in blueprints:
+        if not app.config[f'ENABLE_{name.upper()}']:
+            continue
+        module_path, attr, url_prefix = BLUEPRINTS[name]
+        module = importlib.import_module(module_path)
+        app.register_blueprint(getattr(module, attr), url_prefix=url_prefix)
 
+    # Resolve the landing page template once; in debug mode keep looking it
+    # up by name so the template auto-reloader still sees edits
+    index_template = 'index.html' if app.debug else app.jinja_env.get_template('index.html')
+
+    # The landing page has no per-user content, so render it once. Debug
+    # runs skip the cache so template edits show up on reload.
     @app.route('/')
+    @cache.cached(timeout=3600, key_prefix='index_html', unless=lambda: app.debug)
     def index():
-        return render_template('index.html')
-    
+        return render_template(index_template)
+
+    @app.route('/healthz')
+    def healthz():
+        return 'ok'
+
     # Minimal logout stub
     @app.route('/logout')
     def logout():
-        return render_template('index.html')
+        return redirect(url_for('index'))
+
+    # Compile every template up front so the first request to each page does
+    # not pay for it; under --preload the workers inherit the compiled code.
+    # A minimal app serves no tool pages, so it skips this.
+    if not minimal and app.config.get('WARM_TEMPLATES', not app.config['TESTING']):
+        for template_name in app.jinja_env.list_templates(extensions=['html']):
+            app.jinja_env.get_template(template_name)
+
+    # Compile the URL matcher now, after every rule is registered, instead of
+    # on the first request; under --preload the workers inherit it.
+    app.url_map.update()
+
+    if os.getenv('PROFILE_REQUESTS'):
+        _init_request_profiler(app)
+
+    if profiler:
+        profiler.stop()
+        _log_profile(app, "Startup profile", profiler)
 
     return app
 
+def run_dev_server(app):
+    """Serve app with Flask's development server, for app.py and run.py."""
+    # Threads let the dev server overlap slow calls to the external APIs.
+    # DEV_PROCS > 1 forks worker processes instead, which the reloader
+    # does not support. Production should use Gunicorn or Uvicorn.
+    processes = int(os.getenv("DEV_PROCS", "1"))
+    if processes > 1:
+        app.run(host="0.0.0.0", port=5003, debug=True, threaded=False,
+                processes=processes, use_reloader=False)
+    else:
+        app.run(host="0.0.0.0", port=5003, debug=True, threaded=True)
+
 if __name__ == "__main__":
-    app = create_app()
-    app.run(host="0.0.0.0", port=5003, debug=True)
\ No newline at end of file
+    if "--check" in sys.argv:
+        create_app(minimal=True)
+        sys.exit(0)
+
+    run_dev_server(create_app())
@@ -0,0 +1,16 @@
+"""
+ASGI entry point for production deployment.
+Use this file with Uvicorn: uvicorn asgi:app --workers 4
+"""
+from asgiref.wsgi import WsgiToAsgi
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app
+
+app = WsgiToAsgi(create_app())
+
+if __name__ == "__main__":
+    import uvicorn
+    uvicorn.run("asgi:app", host="0.0.0.0", port=5003, workers=1)
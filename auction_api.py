@@ -1,16 +1,43 @@
 import os
+import re
 import requests
 import logging
 import json
+import orjson
+import pytz
 from typing import Dict, Optional
 from bs4 import BeautifulSoup
+from cachelib import SimpleCache
 from datetime import datetime
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests.exceptions import RequestException, HTTPError, ConnectionError, Timeout
 from config import BASE_API_URL
+from utils.auction_utils import DROP_TAGS
 
 # Get module logger
 logger = logging.getLogger(__name__)
 
+# Auctions are scheduled in Nashville time, whatever the server's timezone
+AUCTION_TZ = pytz.timezone('America/Chicago')
+
+# Whole elements cut from the raw HTML before it is parsed
+_DROP_RE = re.compile(r'<(%s)\b[^>]*>.*?</\1\s*>' % '|'.join(DROP_TAGS), re.IGNORECASE | re.DOTALL)
+
+# Formatting of the details returned by get_auction_details
+DATE_FORMAT = '%Y-%m-%d'
+LOCATION_FIELDS = ('address', 'city', 'state', 'zip')
+
+# Seconds a fetched auction's details are reused before asking the API again
+DETAILS_CACHE_TTL = 300
+
+# Auctions whose details are kept; expired and then oldest entries go first
+DETAILS_CACHE_SIZE = 512
+
+# (connect, read) timeouts in seconds: fail fast on an unreachable host
+# without cutting off a slow response
+API_TIMEOUT = (3.05, 10)
+
 class AuctionAPIError(Exception):
     """Base exception for auction API errors"""
     pass
@@ -32,6 +59,25 @@ class AuctionMethodAPI:
             'Content-Type': 'application/json',
             'Accept': 'application/json'
         }
+        # Keep the HTTPS connection to the API open between requests. The
+        # client is shared by every thread in the process, so let the pool
+        # hold a connection per concurrent request instead of requests' 10.
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Retry failed connects and brief API hiccups with backoff; once
+        # retries run out the last response is returned so raise_for_status
+        # reports it as before. read=False re-raises a read timeout as is,
+        # so a slow API surfaces as Timeout after one attempt (read=0 would
+        # wrap it in MaxRetryError, which requests reports as ConnectionError).
+        retries = Retry(connect=3, read=False, status=3, backoff_factor=0.5,
+                        status_forcelist=[429, 502, 503, 504],
+                        allowed_methods=['GET'], raise_on_status=False)
+        self.session.mount('https://', HTTPAdapter(pool_connections=10, pool_maxsize=20,
+                                                   max_retries=retries))
+        # auction_code -> details. SimpleCache stores entries pickled, so
+        # every hit hands back a fresh copy
+        self._details_cache = SimpleCache(threshold=DETAILS_CACHE_SIZE,
+                                          default_timeout=DETAILS_CACHE_TTL)
         logger.info("Initialized AuctionMethodAPI with URL: %s", self.base_url)
 
     def get_auction_details(self, auction_code: str) -> Dict:
@@ -47,13 +93,25 @@ class AuctionMethodAPI:
         if not auction_code:
             raise ValueError("Auction code cannot be empty")
             
+        # Auction details rarely change, and the same auction is looked up
+        # several times while a letter is prepared
+        cached = self._details_cache.get(auction_code)
+        if cached is not None:
+            return cached
+            
+        details = self._fetch_auction_details(auction_code)
+        self._details_cache.set(auction_code, details)
+        return details
+
+    def _fetch_auction_details(self, auction_code: str) -> Dict:
+        """Request and format auction details, bypassing the cache"""
         try:
             # Direct URL to auction endpoint
             url = f"https://www.mclemoreauction.com/uapi/auction/{auction_code}"
             logger.info("Fetching auction details from: %s", url)
             
             try:
-                response = requests.get(url, headers=self.headers, timeout=10)
+                response = self.session.get(url, timeout=API_TIMEOUT)
                 response.raise_for_status()
             except Timeout:
                 logger.error("Request timed out for auction %s", auction_code)
@@ -69,7 +127,7 @@ class AuctionMethodAPI:
                 raise
             
             try:
-                data = response.json()
+                data = orjson.loads(response.content)
             except json.JSONDecodeError as e:
                 logger.error("Invalid JSON response for auction %s: %s", auction_code, str(e))
                 raise AuctionAPIError("Invalid API response format") from e
@@ -82,7 +140,7 @@ class AuctionMethodAPI:
             # Convert timestamp to date string if present
             starts = auction_data.get('starts')
             try:
-                date_str = datetime.fromtimestamp(int(starts)).strftime('%Y-%m-%d') if starts else ''
+                date_str = datetime.fromtimestamp(int(starts), tz=AUCTION_TZ).strftime(DATE_FORMAT) if starts else ''
             except (ValueError, TypeError) as e:
                 logger.warning("Invalid timestamp for auction %s: %s", auction_code, str(e))
                 date_str = ''
@@ -90,12 +148,13 @@ class AuctionMethodAPI:
             # Clean description using BeautifulSoup
             description = self._clean_description(auction_data.get('description', ''))
             
+            address, city, state, zip_code = (auction_data.get(key, '') for key in LOCATION_FIELDS)
             return {
                 'title': auction_data.get('title', ''),
                 'description': description,
                 'date': date_str,
                 'time': auction_data.get('timezone', ''),
-                'location': f"{auction_data.get('address', '')}, {auction_data.get('city', '')}, {auction_data.get('state', '')} {auction_data.get('zip', '')}",
+                'location': f"{address}, {city}, {state} {zip_code}",
                 'auction_code': auction_code
             }
             
@@ -120,19 +179,43 @@ class AuctionMethodAPI:
         if not description:
             return ''
             
+        # Plain-text descriptions need no parser, only whitespace cleanup
+        if '<' not in description and '&' not in description:
+            return self._join_lines(description)
+            
         try:
-            soup = BeautifulSoup(description, 'html.parser')
+            # Cut closed script/style blocks before parsing so the parser
+            # does not build nodes only to throw them away
+            soup = BeautifulSoup(_DROP_RE.sub('', description), 'lxml')
             
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
+            # Remove any script and style elements the pattern missed
+            for script in soup(DROP_TAGS):
                 script.decompose()
                 
             # Get text and clean whitespace
-            text = soup.get_text(separator=' ')
-            lines = [line.strip() for line in text.splitlines() if line.strip()]
-            return ' '.join(lines)
+            return self._join_lines(soup.get_text(separator=' '))
             
         except Exception as e:
             # Log but don't raise - return empty string for any parsing errors
             logger.warning("Error cleaning description: %s", str(e))
             return ''
+
+    @staticmethod
+    def _join_lines(text: str) -> str:
+        """Strip each line of text and join the non-blank ones with spaces"""
+        lines = [line.strip() for line in text.splitlines() if line.strip()]
+        return ' '.join(lines)
+
+_api = None
+
+def get_auction_api() -> AuctionMethodAPI:
+    """
+    Return the shared AuctionMethodAPI client, creating it on first use
+    
+    Returns:
+        AuctionMethodAPI: Process-wide API client
+    """
+    global _api
+    if _api is None:
+        _api = AuctionMethodAPI()
+    return _api
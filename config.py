@@ -1,10 +1,9 @@
 """Application configuration."""
 import os
 from typing import List
-from dotenv import load_dotenv
 
-# Load environment variables
-load_dotenv()
+# Environment variables are read here at import. Entry points (run.py,
+# wsgi.py, asgi.py) load .env before importing the app.
 
 # Constants
 BASE_AUCTION_URL = os.getenv('BASE_AUCTION_URL', 'https://www.mclemoreauction.com')
@@ -17,6 +16,10 @@ class Config:
     # Flask
     SECRET_KEY = os.getenv('SECRET_KEY', 'dev_key')  # Fallback for development
     
+    # Caching
+    CACHE_TYPE = 'SimpleCache'
+    CACHE_DEFAULT_TIMEOUT = 300
+    
     # API Keys
     AM_API_KEY = os.getenv('AM_API_KEY')
     LOB_API_KEY = os.getenv('LOB_API_KEY')
@@ -54,6 +57,7 @@ class TestingConfig(Config):
     DEBUG = True
     TESTING = True
     SECRET_KEY = 'test_key'
+    ENABLE_CSRF = False
 
 # Configuration dictionary
 config = {
@@ -1,6 +1,6 @@
+import re
 import pandas as pd
 import logging
-import traceback
 from typing import Tuple, Dict, List, Optional
 from dataclasses import dataclass
 
@@ -49,10 +49,54 @@ class CSVProcessor:
         'Owner Zip': str
     }
 
+    # CRS columns mapped to their manual-format equivalents
+    CRS_COLUMN_MAP = {
+        'Owner 1': 'Name',
+        'Owner Address': 'Address',
+        'Owner City': 'City',
+        'Owner State': 'State',
+        'Owner Zip': 'Zip'
+    }
+
+    # Column sets checked by detect_csv_format, built once
+    CRS_FIELDS = frozenset(CRS_REQUIRED_COLUMNS)
+    MANUAL_FIELDS = frozenset(MANUAL_REQUIRED_COLUMNS)
+    KNOWN_COLUMNS = CRS_FIELDS | MANUAL_FIELDS
+
+    # Owner names that are not neighbors to write to (matched anywhere,
+    # any case, including the common "cemetary" misspelling)
+    _CEMETERY_RE = re.compile(r'cemet[ae]ry|memorial|church', re.IGNORECASE)
+
     def __init__(self):
         """Initialize CSV processor"""
         self.stats = ProcessingStats()
 
+    @classmethod
+    def read_csv_for_processing(cls, source) -> pd.DataFrame:
+        """
+        Read an uploaded CSV for process_csv_data
+        
+        Only the columns of a known format are parsed, and every cell is read
+        as text, which skips dtype inference and keeps leading zeros in ZIP
+        codes. The full header is kept in df.attrs['source_columns'] so an
+        unrecognized upload can still be reported with all its columns.
+        
+        Args:
+            source: Path or file-like object holding the CSV
+            
+        Returns:
+            pd.DataFrame: The known columns of the CSV
+        """
+        header = []
+        
+        def is_known(col):
+            header.append(col.strip())
+            return col.strip() in cls.KNOWN_COLUMNS
+        
+        df = pd.read_csv(source, dtype=str, engine='c', usecols=is_known)
+        df.attrs['source_columns'] = list(dict.fromkeys(header))
+        return df
+
     def detect_csv_format(self, df: pd.DataFrame) -> str:
         """
         Detect if the CSV is in CRS or manual format
@@ -73,31 +117,41 @@ class CSVProcessor:
         try:
             # Clean up column names - remove any trailing whitespace
             df.columns = df.columns.str.strip()
-            columns = set(df.columns)
-            logger.info(f"Detecting CSV format. Available columns: {sorted(list(columns))}")
+            columns = frozenset(df.columns)
+            
+            # Reuse the result of an earlier call on the same columns
+            cached = df.attrs.get('csv_format')
+            if cached and cached[0] == columns:
+                return cached[1]
+                
+            # A frame from read_csv_for_processing only holds the known
+            # columns; report everything the user uploaded
+            available = sorted(df.attrs.get('source_columns', columns))
+            logger.info("Detecting CSV format. Available columns: %s", available)
             
             # Check for CRS format - we only need Owner 1 and the address fields
-            crs_fields = {'Owner 1', 'Owner Address', 'Owner City', 'Owner State', 'Owner Zip'}
-            if all(col in columns for col in crs_fields):
+            if self.CRS_FIELDS <= columns:
                 logger.info("CRS format detected")
+                df.attrs['csv_format'] = (columns, 'crs')
                 return 'crs'
                 
             # Check for manual format
-            if all(col in columns for col in self.MANUAL_REQUIRED_COLUMNS.keys()):
+            if self.MANUAL_FIELDS <= columns:
                 logger.info("Manual format detected")
+                df.attrs['csv_format'] = (columns, 'manual')
                 return 'manual'
                 
             # If neither format matches, show helpful error
-            missing_crs = [col for col in crs_fields if col not in columns]
+            missing_crs = [col for col in self.CRS_REQUIRED_COLUMNS if col not in columns]
             missing_manual = [col for col in self.MANUAL_REQUIRED_COLUMNS.keys() if col not in columns]
             
             error_msg = (
                 "CSV format not recognized. Your CSV must have either:\n"
-                "1. CRS format with columns: " + ", ".join(crs_fields) + "\n"
+                "1. CRS format with columns: " + ", ".join(self.CRS_REQUIRED_COLUMNS) + "\n"
                 "2. Manual format with columns: " + ", ".join(self.MANUAL_REQUIRED_COLUMNS.keys()) + "\n\n"
                 f"Missing columns for CRS format: {missing_crs}\n"
                 f"Missing columns for manual format: {missing_manual}\n\n"
-                f"Available columns in your CSV: {sorted(list(columns))}"
+                f"Available columns in your CSV: {available}"
             )
             logger.error(error_msg)
             raise CSVFormatError(error_msg)
@@ -106,166 +160,10 @@ class CSVProcessor:
             logger.error("Empty DataFrame provided")
             raise CSVFormatError("CSV file is empty") from e
         except Exception as e:
-            logger.error(f"Unexpected error detecting CSV format: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            # process_csv_data logs the traceback, with this error chained
+            logger.error("Unexpected error detecting CSV format: %s", e)
             raise CSVProcessorError("Error detecting CSV format") from e
 
-    def truncate_name(self, name: str) -> str:
-        """
-        Truncate name to 40 characters and remove any partial words
-        
-        Args:
-            name: Full name string
-            
-        Returns:
-            str: Truncated name
-            
-        Raises:
-            DataValidationError: If name is invalid
-        """
-        try:
-            if not name or pd.isna(name) or len(str(name).strip()) == 0:
-                raise DataValidationError("Name cannot be empty")
-                
-            name = str(name).strip()
-            if len(name) <= 40:
-                return name
-                
-            # Truncate at last complete word before 40 chars
-            truncated = name[:40].rsplit(' ', 1)[0]
-            logger.info(f"Truncated name from '{name}' to '{truncated}'")
-            return truncated
-            
-        except (AttributeError, TypeError) as e:
-            logger.error(f"Invalid name format: {str(e)}")
-            raise DataValidationError(f"Invalid name format: {str(e)}") from e
-
-    def clean_address_field(self, value: str) -> str:
-        """Clean and validate an address field"""
-        if pd.isna(value):
-            return ""
-        return str(value).strip()
-
-    def process_crs_row(self, row: pd.Series) -> dict:
-        """
-        Process a row from CRS format CSV
-        
-        Args:
-            row: Pandas Series containing row data
-            
-        Returns:
-            dict: Processed address data
-            
-        Raises:
-            DataValidationError: If data validation fails
-        """
-        try:
-            # Log row data for debugging
-            logger.debug(f"Processing CRS row: {row.to_dict()}")
-            
-            # Get owner name and truncate if needed
-            name = row.get('Owner 1', '')
-            if pd.isna(name) or not str(name).strip():
-                logger.warning(f"Empty name in row: {row.to_dict()}")
-                raise DataValidationError("Name is required")
-                
-            name = self.truncate_name(name)
-            if not name:
-                raise DataValidationError("Name is required")
-            
-            # Get and clean address fields
-            address = self.clean_address_field(row.get('Owner Address', ''))
-            city = self.clean_address_field(row.get('Owner City', ''))
-            state = self.clean_address_field(row.get('Owner State', ''))
-            zip_code = self.clean_address_field(row.get('Owner Zip', ''))
-            
-            # Validate required fields
-            missing = []
-            if not address: missing.append('Owner Address')
-            if not city: missing.append('Owner City')
-            if not state: missing.append('Owner State')
-            if not zip_code: missing.append('Owner Zip')
-            
-            if missing:
-                raise DataValidationError(f"Missing required fields: {', '.join(missing)}")
-            
-            processed = {
-                'Name': name,
-                'Address': address,
-                'City': city,
-                'State': state,
-                'Zip': zip_code
-            }
-            
-            logger.debug(f"Processed CRS row: {processed}")
-            return processed
-            
-        except Exception as e:
-            logger.error(f"Error processing CRS row: {str(e)}")
-            logger.error(f"Row data: {row.to_dict()}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            raise DataValidationError(f"Error processing row: {str(e)}")
-
-    def process_manual_row(self, row: pd.Series) -> dict:
-        """
-        Process a row from manual format CSV
-        
-        Args:
-            row: Pandas Series containing row data
-            
-        Returns:
-            dict: Processed address data
-            
-        Raises:
-            DataValidationError: If data validation fails
-        """
-        try:
-            # Log row data for debugging
-            logger.debug(f"Processing manual row: {row.to_dict()}")
-            
-            # Get name and truncate if needed
-            name = row.get('Name', '')
-            if pd.isna(name) or not str(name).strip():
-                logger.warning(f"Empty name in row: {row.to_dict()}")
-                raise DataValidationError("Name is required")
-                
-            name = self.truncate_name(name)
-            if not name:
-                raise DataValidationError("Name is required")
-            
-            # Get and clean address fields
-            address = self.clean_address_field(row.get('Address', ''))
-            city = self.clean_address_field(row.get('City', ''))
-            state = self.clean_address_field(row.get('State', ''))
-            zip_code = self.clean_address_field(row.get('Zip', ''))
-            
-            # Validate required fields
-            missing = []
-            if not address: missing.append('Address')
-            if not city: missing.append('City')
-            if not state: missing.append('State')
-            if not zip_code: missing.append('Zip')
-            
-            if missing:
-                raise DataValidationError(f"Missing required fields: {', '.join(missing)}")
-            
-            processed = {
-                'Name': name,
-                'Address': address,
-                'City': city,
-                'State': state,
-                'Zip': zip_code
-            }
-            
-            logger.debug(f"Processed manual row: {processed}")
-            return processed
-            
-        except Exception as e:
-            logger.error(f"Error processing manual row: {str(e)}")
-            logger.error(f"Row data: {row.to_dict()}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
-            raise DataValidationError(f"Error processing row: {str(e)}")
-
     def process_csv_data(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict]:
         """
         Process CSV data and return processed DataFrame and stats
@@ -283,80 +181,60 @@ class CSVProcessor:
         try:
             # Clean up column names
             df.columns = df.columns.str.strip()
-            logger.info(f"Processing CSV with shape: {df.shape}")
-            logger.info(f"Columns after cleanup: {list(df.columns)}")
-            
-            # Fill NaN values with empty strings
-            df = df.fillna('')
+            logger.info("Processing CSV with shape: %s", df.shape)
+            logger.info("Columns after cleanup: %s", list(df.columns))
             
             self.stats.total_rows = len(df)
             
             # Detect format
             format_type = self.detect_csv_format(df)
             self.stats.format_detected = format_type
-            logger.info(f"Format detected: {format_type}")
-            
-            # Process rows based on format
-            processed_data = []
-            seen_addresses = set()  # Track unique addresses
-            
-            for idx, row in df.iterrows():
-                try:
-                    # Skip cemetery records
-                    name = row['Owner 1'] if format_type == 'crs' else row['Name']
-                    name = str(name).lower()
-                    if not name or any(term in name for term in ['cemetery', 'cemetary', 'memorial', 'church']):
-                        self.stats.cemetery_records_skipped = self.stats.cemetery_records_skipped + 1
-                        logger.info(f"Skipped cemetery/church record: {name}")
-                        continue
-                    
-                    # Process row based on format
-                    if format_type == 'crs':
-                        processed_row = self.process_crs_row(row)
-                    else:
-                        processed_row = self.process_manual_row(row)
-                    
-                    # Check for duplicates
-                    address_key = (
-                        processed_row['Address'].lower(),
-                        processed_row['City'].lower(),
-                        processed_row['State'].lower(),
-                        processed_row['Zip']
-                    )
-                    
-                    if address_key in seen_addresses:
-                        self.stats.duplicate_rows = self.stats.duplicate_rows + 1
-                        logger.info(f"Skipped duplicate address: {processed_row['Address']}")
-                        continue
-                        
-                    seen_addresses.add(address_key)
-                    processed_data.append(processed_row)
-                    self.stats.processed_rows += 1
-                    
-                except DataValidationError as e:
-                    logger.warning(f"Skipping invalid row {idx}: {str(e)}")
-                    self.stats.skipped_rows += 1
-                    continue
-                except Exception as e:
-                    logger.error(f"Error processing row {idx}: {str(e)}")
-                    logger.error(f"Row data: {row.to_dict()}")
-                    logger.error(f"Traceback: {traceback.format_exc()}")
-                    self.stats.skipped_rows += 1
-                    continue
-            
-            if not processed_data:
+            logger.info("Format detected: %s", format_type)
+            
+            # Select the address columns under their manual-format names.
+            # Missing values are filled on these five columns only, not on
+            # every column of a wide CRS export.
+            if format_type == 'crs':
+                column_map = self.CRS_COLUMN_MAP
+            else:
+                column_map = {col: col for col in self.MANUAL_REQUIRED_COLUMNS}
+            raw = df[list(column_map)].fillna('').rename(columns=column_map).astype(str)
+            
+            # Skip cemetery/church records (and rows without a name)
+            is_cemetery = (raw['Name'] == '') | raw['Name'].str.contains(self._CEMETERY_RE)
+            
+            # Skip rows missing any required field
+            result_df = raw.apply(lambda col: col.str.strip())
+            is_invalid = ~is_cemetery & (result_df == '').any(axis=1)
+            
+            # Skip repeated addresses, keeping the first occurrence. Only the
+            # valid rows are lowercased and hashed.
+            is_valid = ~is_cemetery & ~is_invalid
+            valid_df = result_df[is_valid]
+            address_key = valid_df[['Address', 'City', 'State']].apply(lambda col: col.str.lower())
+            address_key['Zip'] = valid_df['Zip']
+            is_duplicate = is_valid.copy()
+            is_duplicate[is_valid] = address_key.duplicated().to_numpy()
+            
+            keep = is_valid & ~is_duplicate
+            self.stats.cemetery_records_skipped = int(is_cemetery.sum())
+            self.stats.skipped_rows = int(is_invalid.sum())
+            self.stats.duplicate_rows = int(is_duplicate.sum())
+            self.stats.processed_rows = int(keep.sum())
+            
+            if not self.stats.processed_rows:
                 raise DataValidationError("No valid rows found in CSV file")
-                
-            # Create DataFrame from processed data
-            result_df = pd.DataFrame(processed_data)
             
-            # Remove any remaining duplicates
-            result_df = result_df.drop_duplicates(subset=['Address', 'City', 'State', 'Zip'])
+            result_df = result_df[keep].reset_index(drop=True)
+            
+            # Truncate long names at the last complete word before 40 chars
+            is_long = result_df['Name'].str.len() > 40
+            result_df.loc[is_long, 'Name'] = (
+                result_df.loc[is_long, 'Name'].str.slice(0, 40).str.replace(r' [^ ]*$', '', regex=True))
             
-            logger.info(f"Finished processing CSV. Stats: {self.stats}")
+            logger.info("Finished processing CSV. Stats: %s", self.stats)
             return result_df, self.stats.__dict__
             
         except Exception as e:
-            logger.error(f"Error processing CSV data: {str(e)}")
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            logger.exception("Error processing CSV data: %s", e)
             raise CSVProcessorError("Error processing CSV data") from e
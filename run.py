@@ -2,9 +2,13 @@
 Entry point for running the McLemore Auction Tools application.
 This file is used for local development. For production, use Gunicorn with app:create_app().
 """
-from app import create_app
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app import create_app, run_dev_server
 
 app = create_app()
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=5003, debug=True)
+    run_dev_server(app)
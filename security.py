@@ -1,5 +1,6 @@
 from functools import wraps
 from flask import session, request, abort, redirect, url_for, Blueprint
+import hmac
 import secrets
 
 security_bp = Blueprint('security', __name__)
@@ -15,11 +16,18 @@ def init_security(app):
     # Register security blueprint
     app.register_blueprint(security_bp)
     
+    # Static file endpoints never need a token; collected on the first POST,
+    # once every blueprint is registered
+    exempt_endpoints = None
+
     # CSRF Protection
     @app.before_request
     def csrf_protect():
+        nonlocal exempt_endpoints
         if request.method == "POST":
-            if request.endpoint and 'static' in request.endpoint:
+            if exempt_endpoints is None:
+                exempt_endpoints = frozenset(ep for ep in app.view_functions if 'static' in ep)
+            if request.endpoint in exempt_endpoints:
                 return
                 
             token = session.get('_csrf_token', None)
@@ -34,8 +42,10 @@ def init_security(app):
                 request.headers.get('X-CSRF-Token')  # Headers
             )
             
-            if not client_token or client_token != token:
-                app.logger.error(f"CSRF token mismatch. Session token: {token}, Client token: {client_token}")
+            # Constant-time comparison so response timing reveals nothing
+            if not isinstance(client_token, str) or not hmac.compare_digest(
+                    client_token.encode(), token.encode()):
+                app.logger.error("CSRF token mismatch. Client token: %s", client_token)
                 abort(403)
 
     def generate_csrf_token():
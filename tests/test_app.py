@@ -0,0 +1,48 @@
+"""
+Tests for the application factory
+"""
+import pytest
+from flask import template_rendered
+from app import create_app
+
+def test_healthz(client):
+    """Test that the health check answers on the full app."""
+    response = client.get('/healthz')
+
+    assert response.status_code == 200
+    assert response.data == b'ok'
+
+def test_minimal_app():
+    """Test that a minimal app registers no tools and warms no templates."""
+    app = create_app({'TESTING': True, 'WARM_TEMPLATES': True}, minimal=True)
+
+    assert 'neighbor_letters' not in app.blueprints
+    assert 'qr_labels_bp' not in app.blueprints
+    assert not app.config['ENABLE_NEIGHBOR_LETTERS']
+    assert not app.config['ENABLE_QR_LABELS']
+
+    # Only the landing page, resolved when the index route is built
+    assert [name for _, name in app.jinja_env.cache.keys()] == ['index.html']
+
+    response = app.test_client().get('/healthz')
+    assert response.status_code == 200
+    assert response.data == b'ok'
+
+def test_unknown_blueprint():
+    """Test that a misspelled blueprint name is reported with the valid ones."""
+    with pytest.raises(ValueError, match="Unknown blueprint 'qr_label'; expected one of neighbor_letters, qr_labels"):
+        create_app({'TESTING': True}, blueprints=('qr_label',))
+
+def test_index_not_cached_in_debug(app, client):
+    """Test that the landing page is re-rendered on every request in debug mode."""
+    app.debug = True
+    rendered = []
+
+    def record(sender, template, context, **extra):
+        rendered.append(template.name)
+
+    with template_rendered.connected_to(record, app):
+        client.get('/')
+        client.get('/')
+
+    assert rendered == ['index.html', 'index.html']
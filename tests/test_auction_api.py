@@ -0,0 +1,79 @@
+"""
+Tests for the auction details cache
+"""
+import time
+import socket
+import threading
+import pytest
+import cachelib.simple
+from requests.exceptions import Timeout
+from auction_api import AuctionMethodAPI, DETAILS_CACHE_TTL
+
+@pytest.fixture
+def api(monkeypatch):
+    """An API client whose fetches are counted instead of sent."""
+    monkeypatch.setenv('AM_API_KEY', 'test')
+    client = AuctionMethodAPI()
+    client.fetches = []
+
+    def fetch(auction_code):
+        client.fetches.append(auction_code)
+        return {'auction_code': auction_code, 'title': f"Auction {auction_code}"}
+
+    monkeypatch.setattr(client, '_fetch_auction_details', fetch)
+    return client
+
+def test_details_cache_hit(api):
+    """Test that a repeat lookup is served from the cache."""
+    first = api.get_auction_details('TEST123')
+    second = api.get_auction_details('TEST123')
+
+    assert first == second == {'auction_code': 'TEST123', 'title': 'Auction TEST123'}
+    assert api.fetches == ['TEST123']
+
+def test_details_cache_expiry(api, monkeypatch):
+    """Test that details are fetched again once the TTL has passed."""
+    api.get_auction_details('TEST123')
+
+    now = time.time()
+    monkeypatch.setattr(cachelib.simple, 'time', lambda: now + DETAILS_CACHE_TTL + 1)
+    api.get_auction_details('TEST123')
+
+    assert api.fetches == ['TEST123', 'TEST123']
+
+def test_details_cache_returns_copy(api):
+    """Test that edits to returned details do not leak into the cache."""
+    api.get_auction_details('TEST123')['title'] = 'Edited'
+    api.get_auction_details('TEST123')['title'] = 'Edited again'
+
+    assert api.get_auction_details('TEST123')['title'] == 'Auction TEST123'
+    assert api.fetches == ['TEST123']
+
+def test_read_timeout_is_not_retried(monkeypatch):
+    """Test that a read timeout raises Timeout after a single attempt."""
+    monkeypatch.setenv('AM_API_KEY', 'test')
+    client = AuctionMethodAPI()
+    # Use the API adapter, and its retry policy, for a local plain-HTTP server
+    client.session.mount('http://', client.session.get_adapter('https://'))
+
+    connections = []
+    with socket.create_server(('127.0.0.1', 0)) as server:
+        server.settimeout(2)
+
+        def accept():
+            # Accept every connection but never answer
+            try:
+                while True:
+                    connections.append(server.accept()[0])
+            except OSError:
+                pass
+        thread = threading.Thread(target=accept, daemon=True)
+        thread.start()
+
+        with pytest.raises(Timeout):
+            client.session.get(f"http://127.0.0.1:{server.getsockname()[1]}/", timeout=(1, 0.2))
+        time.sleep(0.3)
+
+    for conn in connections:
+        conn.close()
+    assert len(connections) == 1
@@ -4,7 +4,7 @@ Tests for CSV processing functionality
 import pytest
 import pandas as pd
 from io import StringIO
-from csv_processor import CSVProcessor
+from csv_processor import CSVProcessor, CSVProcessorError
 
 def test_valid_csv_processing(sample_csv_data):
     """Test processing of valid CSV data."""
@@ -76,3 +76,47 @@ Jane Smith,123 Main St,Springfield,IL,62701"""  # Exact same address
     assert stats['duplicate_rows'] == 1  # Second row should be counted as duplicate
     assert len(result_df) == 1  # Only first row should be kept
     assert result_df.iloc[0]['Name'] == 'John Doe'  # First row should be kept
+
+def test_cemetery_records_and_long_names():
+    """Test that cemetery/church rows are skipped and long names are truncated."""
+    csv_data = """Owner 1,Owner Address,Owner City,Owner State,Owner Zip
+Greenwood Cemetery,1 Grave Rd,Springfield,IL,62701
+First Baptist Church,2 Chapel St,Springfield,IL,62701
+Johnathan Alexander Worthington Smithson III,3 Elm St,Springfield,IL,62702
+Jane Smith,,Springfield,IL,62703"""
+    
+    processor = CSVProcessor()
+    df = pd.read_csv(StringIO(csv_data))
+    result_df, stats = processor.process_csv_data(df)
+    
+    assert stats['format_detected'] == 'crs'
+    assert stats['cemetery_records_skipped'] == 2
+    assert stats['skipped_rows'] == 1  # Missing address
+    assert stats['processed_rows'] == 1
+    assert list(result_df.columns) == ['Name', 'Address', 'City', 'State', 'Zip']
+    assert result_df.iloc[0]['Name'] == 'Johnathan Alexander Worthington'
+
+def test_read_csv_for_processing():
+    """Test that only known columns are read, as text."""
+    csv_data = """Parcel ID, Owner 1 ,Owner Address,Owner City,Owner State,Owner Zip,Acres
+001,Jane Smith,1 Elm St,Springfield,IL,02701,1.5"""
+    
+    df = CSVProcessor.read_csv_for_processing(StringIO(csv_data))
+    
+    assert list(df.columns) == [' Owner 1 ', 'Owner Address', 'Owner City', 'Owner State', 'Owner Zip']
+    assert df.iloc[0]['Owner Zip'] == '02701'  # Leading zero kept
+    
+    result_df, stats = CSVProcessor().process_csv_data(df)
+    assert stats['format_detected'] == 'crs'
+    assert result_df.iloc[0]['Name'] == 'Jane Smith'
+
+def test_unrecognized_upload_lists_all_columns():
+    """Test that a format error names every uploaded column, not just known ones."""
+    csv_data = """Parcel ID,Owner 1,Acres
+001,Jane Smith,1.5"""
+    
+    df = CSVProcessor.read_csv_for_processing(StringIO(csv_data))
+    
+    with pytest.raises(CSVProcessorError) as exc_info:
+        CSVProcessor().detect_csv_format(df)
+    assert "Available columns in your CSV: ['Acres', 'Owner 1', 'Parcel ID']" in str(exc_info.value.__cause__)
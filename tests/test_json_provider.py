@@ -0,0 +1,76 @@
+"""
+Tests for the orjson-backed JSON provider
+"""
+import uuid
+import decimal
+import datetime
+import dataclasses
+import pytest
+from flask.json.provider import DefaultJSONProvider
+from utils.json_provider import OrjsonProvider
+
+@dataclasses.dataclass
+class Lot:
+    number: int
+    title: str
+
+PAYLOAD = {
+    'zip': '02701',
+    'date': datetime.date(2024, 1, 2),
+    'starts': datetime.datetime(2024, 1, 2, 13, 30, 5),
+    'deposit': decimal.Decimal('1.50'),
+    'id': uuid.UUID(int=5),
+    'lot': Lot(12, 'Tractor'),
+    'stats': {'total_rows': 2, 'rates': [1, 2.5, None, True], 'empty': {}},
+}
+
+@pytest.mark.parametrize('debug', [False, True])
+@pytest.mark.parametrize('sort_keys', [True, False])
+def test_response_matches_default_provider(app, debug, sort_keys):
+    """Test that responses are byte-for-byte those of Flask's provider."""
+    app.debug = debug
+    default, orjson_provider = DefaultJSONProvider(app), OrjsonProvider(app)
+    default.sort_keys = orjson_provider.sort_keys = sort_keys
+
+    with app.app_context():
+        expected = default.response(PAYLOAD).get_data()
+        assert orjson_provider.response(PAYLOAD).get_data() == expected
+
+def test_non_ascii_is_raw_utf8(app):
+    """Test the documented difference: non-ASCII text is not \\u-escaped."""
+    with app.app_context():
+        assert DefaultJSONProvider(app).response({'name': 'Café'}).get_data() == b'{"name":"Caf\\u00e9"}\n'
+        assert OrjsonProvider(app).response({'name': 'Café'}).get_data() == '{"name":"Café"}\n'.encode()
+
+def test_loads(app):
+    """Test that text and bytes decode as with Flask's provider."""
+    provider = OrjsonProvider(app)
+
+    assert provider.loads('{"a": [1, "é"]}') == {'a': [1, 'é']}
+    assert provider.loads('{"a": [1, "é"]}'.encode()) == {'a': [1, 'é']}
+
+def test_app_uses_orjson_provider(app):
+    """Test that the app factory installs the provider."""
+    assert isinstance(app.json, OrjsonProvider)
+
+def test_large_int_falls_back_to_default(app):
+    """Test that integers beyond 64 bits are serialized as Flask does."""
+    payload = {'big': 2 ** 70, 'small': 1}
+    with app.app_context():
+        assert OrjsonProvider(app).response(payload).get_data() == DefaultJSONProvider(app).response(payload).get_data()
+
+def test_nan_becomes_null(app):
+    """Test the documented difference: NaN and Infinity become null."""
+    assert DefaultJSONProvider(app).dumps({'a': float('nan')}) == '{"a": NaN}'
+    assert OrjsonProvider(app).dumps({'a': float('nan'), 'b': float('inf')}) == '{"a":null,"b":null}'
+
+def test_mixed_keys_are_sorted_as_strings(app):
+    """Test the documented difference: mixed-type keys do not raise."""
+    with pytest.raises(TypeError):
+        DefaultJSONProvider(app).dumps({1: 'a', 'b': 2})
+    assert OrjsonProvider(app).dumps({'b': 2, 1: 'a'}) == '{"1":"a","b":2}'
+
+def test_deeply_nested_body_raises_recursion_error(app):
+    """Test that request bodies are parsed by json.loads, with its recursion limit."""
+    with pytest.raises(RecursionError):
+        OrjsonProvider(app).loads('[' * 100000 + ']' * 100000)
@@ -0,0 +1,51 @@
+"""
+Tests for shared QR code encoding
+"""
+import pytest
+from collections import OrderedDict
+from tools import qr_utils
+
+@pytest.fixture
+def empty_cache(monkeypatch):
+    """Start from an empty encoding cache and shut down any pool started."""
+    monkeypatch.setattr(qr_utils, '_cache', OrderedDict())
+    yield
+    if qr_utils._pool is not None:
+        qr_utils._pool.shutdown()
+        qr_utils._pool = None
+
+def test_encode_many_in_pool_above_threshold(empty_cache, monkeypatch):
+    """Test that large batches are encoded in the pool and then cached."""
+    monkeypatch.setattr(qr_utils, '_usable_cpus', lambda: 2)
+    payloads = [f"AB-{lot}" for lot in range(qr_utils.PARALLEL_MIN_LOTS)]
+
+    codes = qr_utils.encode_many(qr_utils.make_qr, payloads)
+
+    assert qr_utils._pool is not None
+    assert [code.matrix for code in codes] == [qr_utils.make_qr(data).matrix for data in payloads]
+
+    # A reprint of the same lots is served from the cache, not the pool
+    def no_pool():
+        raise AssertionError("pool used for cached codes")
+    monkeypatch.setattr(qr_utils, '_get_pool', no_pool)
+    assert qr_utils.encode_many(qr_utils.make_qr, payloads) == codes
+
+def test_encode_many_below_threshold_stays_in_process(empty_cache, monkeypatch):
+    """Test that small batches never start the pool."""
+    monkeypatch.setattr(qr_utils, '_usable_cpus', lambda: 2)
+    payloads = [f"AB-{lot}" for lot in range(qr_utils.PARALLEL_MIN_LOTS - 1)]
+
+    codes = qr_utils.encode_many(qr_utils.make_qr, payloads)
+
+    assert qr_utils._pool is None
+    assert [code.designator for code in codes] == [qr_utils.make_qr(d).designator for d in payloads]
+
+def test_encode_many_cache_is_bounded(empty_cache, monkeypatch):
+    """Test that the least recently used codes are evicted."""
+    monkeypatch.setattr(qr_utils, 'CACHE_SIZE', 3)
+
+    qr_utils.encode_many(qr_utils.make_qr, ['a', 'b', 'c'])
+    qr_utils.encode_many(qr_utils.make_qr, ['a'])
+    qr_utils.encode_many(qr_utils.make_qr, ['d'])
+
+    assert [data for _, data in qr_utils._cache] == ['c', 'a', 'd']
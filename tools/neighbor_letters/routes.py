@@ -1,11 +1,10 @@
 """Routes for neighbor letters functionality."""
 import os
 import json
-import pandas as pd
 from flask import Blueprint, render_template, request, jsonify, current_app, redirect, url_for, flash
 from csv_processor import CSVProcessor, CSVProcessorError
 from utils.lob_utils import LobClient, Address, LobAPIError
-from auction_api import AuctionMethodAPI, AuctionNotFoundError
+from auction_api import get_auction_api, AuctionNotFoundError
 
 neighbor_letters = Blueprint('neighbor_letters', __name__, url_prefix='/neighbor_letters')
 
@@ -30,7 +29,7 @@ def process_csv_file():
         return jsonify({'success': False, 'message': 'Auction code is required'}), 400
 
     try:
-        df = pd.read_csv(file)
+        df = CSVProcessor.read_csv_for_processing(file.stream)
         processor = CSVProcessor()
         result_df, stats = processor.process_csv_data(df)
 
@@ -102,8 +101,7 @@ def edit(auction_code):
     # Attempt to fetch Auction details
     auction_data = None
     try:
-        api = AuctionMethodAPI()
-        auction_data = api.get_auction_details(auction_code)
+        auction_data = get_auction_api().get_auction_details(auction_code)
         if not auction_data:
             flash(f"Auction {auction_code} not found in AuctionMethod API.", "error")
     except AuctionNotFoundError:
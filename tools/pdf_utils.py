@@ -4,13 +4,16 @@ Shared utilities for PDF and QR code generation
 import qrcode
 from reportlab.lib.pagesizes import letter
 from reportlab.pdfgen import canvas
-from io import BytesIO
+from reportlab.lib.utils import ImageReader
 import tempfile
-import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Label PDFs larger than this are spooled to an anonymous temp file rather
+# than held in memory while they are sent
+PDF_SPOOL_SIZE = 8 * 1024 * 1024
+
 class LabelGenerator:
     def __init__(self, auction_code, starting_lot, ending_lot, label_type="standard"):
         self.auction_code = auction_code
@@ -36,7 +39,7 @@ class LabelGenerator:
             qr.add_data(f"{self.auction_code}-{lot_number}")
             
         qr.make(fit=True)
-        qr_img = qr.make_image(fill_color="black", back_color="white")
+        qr_img = qr.make_image(fill_color="black", back_color="white").get_image()
         
         if size != (45, 45):
             qr_img = qr_img.resize(size)
@@ -73,15 +76,13 @@ class LabelGenerator:
             x = margin_x + col * (label_width + spacing_x)
             y = self.page_height - (margin_y + (row + 1) * label_height + row * spacing_y)
             
-            # Generate and draw QR code
+            # Generate and draw QR code. drawImage cannot read a PNG from a
+            # BytesIO, so hand it the PIL image through ImageReader
             qr_img = self.generate_qr_code(current_lot, size=(50, 50))
-            qr_buffer = BytesIO()
-            qr_img.save(qr_buffer)
-            qr_buffer.seek(0)
             
             # Draw label
             c.rect(x, y, label_width, label_height)
-            c.drawImage(qr_buffer, x + 5, y + 5, width=50, height=50)
+            c.drawImage(ImageReader(qr_img), x + 5, y + 5, width=50, height=50)
             
             # Draw text
             c.setFont("Helvetica", 10)
@@ -99,16 +100,20 @@ class LabelGenerator:
         return buffer
 
     def generate_detailed_labels(self):
-        """Generate detailed labels with URLs (3x10 layout)"""
-        pdf_file = tempfile.NamedTemporaryFile(delete=False, suffix='.pdf')
-        c = canvas.Canvas(pdf_file.name, pagesize=letter)
+        """
+        Generate detailed labels with URLs (3x10 layout). Returns the PDF in
+        a spooled temp file, rewound, which is removed once it is closed.
+        """
+        buffer = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
+        c = canvas.Canvas(buffer, pagesize=letter)
         
         num_sheets = (self.ending_lot - self.starting_lot) // 30 + 1
         for i in range(num_sheets):
             self._generate_detailed_sheet(c, self.starting_lot + i * 30)
         
         c.save()
-        return pdf_file.name
+        buffer.seek(0)
+        return buffer
 
     def _generate_detailed_sheet(self, c, starting_lot):
         """Generate a single sheet of detailed labels"""
@@ -126,27 +131,24 @@ class LabelGenerator:
                     if lot_number > self.ending_lot:
                         continue
                         
-                    # Generate QR code
+                    # Generate QR code; ReportLab reads the image from
+                    # memory, so no temp PNG is written per label
                     qr_img = self.generate_qr_code(lot_number)
-                    temp_file = tempfile.NamedTemporaryFile(delete=False)
-                    qr_img.save(temp_file, 'PNG')
                     
                     # Calculate position
                     x = side_margin + col * label_width + x_adjustment + 6
                     y = self.page_height - top_bottom_margin - row * label_height - 58
                     
                     # Draw label
-                    c.drawImage(temp_file.name, x + 130, y, 50, 50)
+                    c.drawImage(ImageReader(qr_img), x + 130, y, 50, 50)
                     c.setFont("Helvetica", 27)
                     c.drawString(x + 10, y + 15, f"Lot {str(lot_number).zfill(4)}")
                     c.setFont("Helvetica", 12)
                     c.drawString(x + 10, y - 10, "www.McLemoreAuction.com")
-                    
-                    os.unlink(temp_file.name)
             
             c.showPage()
-            logger.info(f"Generated detailed sheet starting with lot {starting_lot}")
+            logger.info("Generated detailed sheet starting with lot %s", starting_lot)
             
         except Exception as e:
-            logger.error(f"Error generating detailed sheet for lot {starting_lot}: {str(e)}")
+            logger.error("Error generating detailed sheet for lot %s: %s", starting_lot, e)
             raise
@@ -1,11 +1,11 @@
 from flask import render_template, request, send_file, current_app, flash, Blueprint
 from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
-import qrcode
-import os
 import tempfile
 import logging
 from config import BASE_AUCTION_URL
+from tools.pdf_utils import PDF_SPOOL_SIZE
+from tools.qr_utils import encode_many, make_qr
 
 qr_labels_bp = Blueprint(
     'qr_labels_bp',
@@ -31,68 +31,93 @@ def generate_labels():
         if starting_lot < 1 or ending_lot < starting_lot:
             raise ValueError("Lot numbers invalid")
 
-        logger.info(f"Generating labels for {auction_code} from {starting_lot} to {ending_lot}")
+        logger.info("Generating labels for %s from %d to %d", auction_code, starting_lot, ending_lot)
 
-        pdf_file_path = os.path.join(tempfile.gettempdir(), "qr_code_sheet.pdf")
-        c = canvas.Canvas(pdf_file_path, pagesize=letter)
+        # Build the PDF in a per-request spool: small sheets stay in memory,
+        # large runs go to an unnamed temp file that is removed once sent
+        buffer = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
+        c = canvas.Canvas(buffer, pagesize=letter)
 
         # Now generate all lots, but create multiple pages if needed:
         generate_sheet_multiple_pages(c, auction_code, start_lot=starting_lot, end_lot=ending_lot)
         c.save()
+        size = buffer.tell()
+        buffer.seek(0)
 
-        response = send_file(pdf_file_path, as_attachment=True, download_name=f"auction_labels_{auction_code}.pdf")
-        response.call_on_close(lambda: os.remove(pdf_file_path))
+        response = send_file(buffer, mimetype='application/pdf', as_attachment=True,
+                             download_name=f"auction_labels_{auction_code}.pdf")
+        # send_file cannot size a spooled file itself
+        response.content_length = size
         return response
 
     except Exception as e:
-        logger.error(f"Error generating labels: {e}")
+        logger.error("Error generating labels: %s", e)
         flash(str(e), 'error')
         return render_template('qr_labels/labels.html'), 400
 
+# Label grid on a letter page: 10 rows of 3, 189x72pt labels inside 36pt
+# top/bottom and 20pt side margins, outer columns nudged 9pt outward.
+# The positions never change, so compute them once.
+LABELS_PER_PAGE = 30
+LABEL_POSITIONS = tuple(
+    (20 + col * 189 + (-9 if col == 0 else (9 if col == 2 else 0)) + 6,
+     792 - 36 - row * 72 - 58)
+    for row in range(10)
+    for col in range(3)
+)
+
+def add_qr_code(path, qr, x, y, size=50, border=1):
+    """
+    Add a QR code to path as vector rectangles with its lower-left corner
+    at (x, y). Each run of dark modules in a row becomes one rectangle, so
+    no raster is encoded or embedded once the path is filled.
+    """
+    width, _ = qr.symbol_size(scale=1, border=border)
+    module = size / width
+
+    for row_index, row in enumerate(qr.matrix_iter(scale=1, border=border)):
+        row_y = y + size - (row_index + 1) * module
+        run_start = None
+        # A trailing light module closes a run that reaches the edge
+        for col_index, dark in enumerate(row + (0,)):
+            if dark and run_start is None:
+                run_start = col_index
+            elif not dark and run_start is not None:
+                path.rect(x + run_start * module, row_y, (col_index - run_start) * module, module)
+                run_start = None
+
 def generate_sheet_multiple_pages(c, auction_code, start_lot, end_lot):
     """
     Generate labels in a 3×10 grid. If we exceed 30 labels, start a new page, etc.
     """
-    page_width, page_height = 612, 792
-    label_width = 189
-    label_height = 72
-    top_bottom_margin = 36
-    side_margin = 20
-
-    current_lot = start_lot
-    while current_lot <= end_lot:
-        for row in range(10):
-            for col in range(3):
-                if current_lot > end_lot:
-                    break
-
-                # Build URL for the lot
-                url = f"{BASE_AUCTION_URL}/auction/{auction_code}/lot/{str(current_lot).zfill(4)}"
-                qr = qrcode.QRCode(version=1, error_correction=qrcode.constants.ERROR_CORRECT_L, box_size=10, border=1)
-                qr.add_data(url)
-                qr.make(fit=True)
-                qr_img = qr.make_image(fill_color="black", back_color="white").resize((45, 45))
-
-                temp_file = tempfile.NamedTemporaryFile(delete=False)
-                qr_img.save(temp_file, 'PNG')
-
-                # Position
-                x_adjustment = -9 if col == 0 else (9 if col == 2 else 0)
-                x_pos = side_margin + col * label_width + x_adjustment + 6
-                y_pos = page_height - top_bottom_margin - row * label_height - 58
-
-                c.drawImage(temp_file.name, x_pos + 130, y_pos, 50, 50)
-                c.setFont("Helvetica", 27)
-                c.drawString(x_pos + 10, y_pos + 15, f"Lot {str(current_lot).zfill(4)}")
-                c.setFont("Helvetica", 12)
-                c.drawString(x_pos + 10, y_pos - 10, "www.McLemoreAuction.com")
-
-                os.unlink(temp_file.name)
-                current_lot += 1
-
-            if current_lot > end_lot:
-                break
+    lots = range(start_lot, end_lot + 1)
+    lot_numbers = [f"{lot:04d}" for lot in lots]
+
+    # Encode every QR code up front; ReportLab then draws them in one process
+    qr_codes = encode_many(make_qr, [
+        f"{BASE_AUCTION_URL}/auction/{auction_code}/lot/{number}"
+        for number in lot_numbers
+    ])
+
+    for page_start in range(0, len(lots), LABELS_PER_PAGE):
+        page_end = page_start + LABELS_PER_PAGE
+        positions = LABEL_POSITIONS[:len(lots[page_start:page_end])]
+
+        # Draw in passes so each font is only set once per page, and every
+        # QR code on the page is filled by one path
+        modules = c.beginPath()
+        for qr, (x_pos, y_pos) in zip(qr_codes[page_start:page_end], positions):
+            add_qr_code(modules, qr, x_pos + 130, y_pos)
+        c.drawPath(modules, stroke=0, fill=1)
+
+        c.setFont("Helvetica", 27)
+        for number, (x_pos, y_pos) in zip(lot_numbers[page_start:page_end], positions):
+            c.drawString(x_pos + 10, y_pos + 15, f"Lot {number}")
+
+        c.setFont("Helvetica", 12)
+        for x_pos, y_pos in positions:
+            c.drawString(x_pos + 10, y_pos - 10, "www.McLemoreAuction.com")
+
         # After 10 rows, start a new page (unless we’re done).
-        if current_lot <= end_lot:
+        if page_end < len(lots):
             c.showPage()
-    # done
\ No newline at end of file
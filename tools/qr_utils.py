@@ -0,0 +1,83 @@
+"""
+QR code encoding shared by the label tools
+"""
+import os
+import threading
+import multiprocessing
+import segno
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+# Below this many lots, worker start-up costs more than it saves
+PARALLEL_MIN_LOTS = 200
+
+# Encoded codes kept per process, so reprinting a run does not encode it again
+CACHE_SIZE = 4096
+
+# Most encoding processes running at once, across all requests
+MAX_WORKERS = 4
+
+# (encoder, payload) -> encoded code, least recently used first
+_cache = OrderedDict()
+_cache_lock = threading.Lock()
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def make_qr(data):
+    """
+    Encode a QR code. segno picks the mask far faster than python-qrcode's
+    pure-Python scoring.
+    """
+    return segno.make(data, error='L', micro=False)
+
+def _usable_cpus():
+    """CPUs this process may run on, honouring affinity and cpusets"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        # Not available on macOS
+        return os.cpu_count() or 1
+
+def _get_pool():
+    """
+    The shared encoding pool, started on first use. Workers are spawned
+    rather than forked, since the web server may be running threads
+    whose held locks a forked child would inherit.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=min(MAX_WORKERS, _usable_cpus()),
+                                        mp_context=multiprocessing.get_context('spawn'))
+        return _pool
+
+def encode_many(encoder, payloads):
+    """
+    Apply encoder (such as make_qr) to many payloads through the
+    per-process cache. When a large batch misses the cache, the misses are
+    encoded in the shared pool. Encoding is CPU-bound, so threads would not
+    help.
+    """
+    results = {}
+    with _cache_lock:
+        for data in payloads:
+            key = (encoder, data)
+            if key in _cache:
+                _cache.move_to_end(key)
+                results[data] = _cache[key]
+
+    missing = [data for data in dict.fromkeys(payloads) if data not in results]
+    if len(missing) >= PARALLEL_MIN_LOTS and _usable_cpus() > 1:
+        encoded = list(_get_pool().map(encoder, missing, chunksize=16))
+    else:
+        encoded = [encoder(data) for data in missing]
+
+    with _cache_lock:
+        for data, code in zip(missing, encoded):
+            _cache[(encoder, data)] = code
+            results[data] = code
+        while len(_cache) > CACHE_SIZE:
+            _cache.popitem(last=False)
+
+    return [results[data] for data in payloads]
@@ -9,6 +9,15 @@ from typing import Optional
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every description, compiled once
+_MANAGER_RE = re.compile('Auction Manager:')
+_MAILTO_RE = re.compile('mailto:')
+_PHONE_RE = re.compile(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_TAG_RE = re.compile('<[^<]+?>')
+
+# Elements whose content is not description text
+DROP_TAGS = ('script', 'style')
+
 @dataclass
 class ManagerInfo:
     """Container for auction manager information"""
@@ -51,8 +60,8 @@ def extract_manager_info(description: str) -> ManagerInfo:
         
     try:
         # Extract manager section using BeautifulSoup for better HTML parsing
-        soup = BeautifulSoup(description, 'html.parser')
-        manager_tag = soup.find(string=re.compile('Auction Manager:'))
+        soup = BeautifulSoup(description, 'lxml')
+        manager_tag = soup.find(string=_MANAGER_RE)
         
         if not manager_tag or not manager_tag.parent:
             logger.warning("Could not find manager section with BeautifulSoup")
@@ -63,16 +72,16 @@ def extract_manager_info(description: str) -> ManagerInfo:
         manager_text = manager_p.get_text()
         
         # Extract email
-        email_tag = manager_p.find('a', href=re.compile('mailto:'))
+        email_tag = manager_p.find('a', href=_MAILTO_RE)
         if email_tag and '@mclemoreauction.com' in email_tag['href']:
             manager.email = email_tag['href'].replace('mailto:', '')
-            logger.debug(f"Found manager email: {manager.email}")
+            logger.debug("Found manager email: %s", manager.email)
             
         # Extract phone using regex
-        phone_match = re.search(r'\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}', manager_text)
+        phone_match = _PHONE_RE.search(manager_text)
         if phone_match:
             manager.phone = phone_match.group()
-            logger.debug(f"Found manager phone: {manager.phone}")
+            logger.debug("Found manager phone: %s", manager.phone)
             
         # Extract name - it's usually between "Auction Manager:" and the phone/email
         name_text = manager_text.split('Auction Manager:')[-1]
@@ -86,11 +95,11 @@ def extract_manager_info(description: str) -> ManagerInfo:
         name_parts = [p.strip() for p in name_text.split() if p.strip()]
         if name_parts:
             manager.name = ' '.join(name_parts)
-            logger.debug(f"Found manager name: {manager.name}")
+            logger.debug("Found manager name: %s", manager.name)
             
     except Exception as e:
-        logger.error(f"Error extracting manager info: {str(e)}")
-        logger.debug(f"Description content: {description[:200]}...")
+        logger.error("Error extracting manager info: %s", e)
+        logger.debug("Description content: %s...", description[:200])
         
     return manager
 
@@ -110,10 +119,10 @@ def clean_auction_description(description: str) -> str:
             description = description.split('<p><b>Auction Manager:')[0]
             
         # Parse and clean remaining HTML
-        soup = BeautifulSoup(description, 'html.parser')
+        soup = BeautifulSoup(description, 'lxml')
         
         # Remove script and style elements
-        for element in soup(['script', 'style']):
+        for element in soup(DROP_TAGS):
             element.decompose()
             
         # Get text and clean whitespace
@@ -122,6 +131,6 @@ def clean_auction_description(description: str) -> str:
         return ' '.join(lines)
         
     except Exception as e:
-        logger.error(f"Error cleaning description: {str(e)}")
+        logger.error("Error cleaning description: %s", e)
         # Return original description with basic HTML stripping as fallback
-        return re.sub('<[^<]+?>', '', description)
+        return _TAG_RE.sub('', description)
@@ -10,6 +10,9 @@ from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# Bytes decoded to find the header lines used for dialect detection
+DIALECT_SAMPLE_SIZE = 64 * 1024
+
 class CSVReadError(Exception):
     """Base exception for CSV reading errors"""
     pass
@@ -32,10 +35,10 @@ def detect_encoding(content: bytes) -> str:
     for encoding in encodings:
         try:
             content.decode(encoding)
-            logger.debug(f"Successfully decoded content with {encoding} encoding")
+            logger.debug("Successfully decoded content with %s encoding", encoding)
             return encoding
         except UnicodeDecodeError:
-            logger.debug(f"Failed to decode with {encoding} encoding")
+            logger.debug("Failed to decode with %s encoding", encoding)
             continue
     
     raise CSVReadError("Could not decode file content with any supported encoding")
@@ -55,17 +58,19 @@ def detect_dialect(content: bytes, encoding: str) -> csv.Dialect:
         CSVReadError: If dialect detection fails
     """
     try:
-        # Read a sample of the file to detect dialect
-        sample = content.decode(encoding).split('\n')[:5]
+        # Read a sample of the file to detect dialect. Only the start is
+        # decoded; a character cut off at the end of it is dropped.
+        head = content[:DIALECT_SAMPLE_SIZE].decode(encoding, errors='ignore')
+        sample = head.split('\n', 5)[:5]
         if not sample:
             raise CSVReadError("Empty file")
             
         dialect = csv.Sniffer().sniff('\n'.join(sample))
-        logger.debug(f"Detected CSV dialect: delimiter='{dialect.delimiter}'")
+        logger.debug("Detected CSV dialect: delimiter='%s'", dialect.delimiter)
         return dialect
         
     except Exception as e:
-        logger.error(f"Error detecting CSV dialect: {str(e)}")
+        logger.error("Error detecting CSV dialect: %s", e)
         raise CSVReadError(f"Failed to detect CSV dialect: {str(e)}")
 
 def read_csv_flexibly(file: Union[str, Path, bytes, BinaryIO, TextIO],
@@ -129,18 +134,18 @@ def read_csv_flexibly(file: Union[str, Path, bytes, BinaryIO, TextIO],
                 **kwargs
             )
             
-            logger.info(f"Successfully read CSV with {len(df)} rows using {encoding} encoding")
+            logger.info("Successfully read CSV with %d rows using %s encoding", len(df), encoding)
             return df
             
         except pd.errors.EmptyDataError:
             logger.warning("Empty CSV file")
             raise
         except Exception as e:
-            logger.error(f"Error reading CSV with pandas: {str(e)}")
+            logger.error("Error reading CSV with pandas: %s", e)
             raise CSVReadError(f"Failed to parse CSV: {str(e)}")
             
     except Exception as e:
         if not isinstance(e, (CSVReadError, pd.errors.EmptyDataError)):
-            logger.error(f"Unexpected error reading CSV: {str(e)}")
+            logger.error("Unexpected error reading CSV: %s", e)
             raise CSVReadError(f"Unexpected error: {str(e)}")
         raise
@@ -51,6 +51,21 @@ class Database:
                 )
             ''')
             
+            # Indexes for the history lookups and status updates, so they
+            # do not scan the whole table as it grows
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_letters_sent_auction
+                ON letters_sent (auction_code, sent_at)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_letters_sent_sent_at
+                ON letters_sent (sent_at)
+            ''')
+            cursor.execute('''
+                CREATE INDEX IF NOT EXISTS idx_letters_sent_campaign
+                ON letters_sent (campaign_id)
+            ''')
+            
             conn.commit()
     
     def log_letter_send(self, 
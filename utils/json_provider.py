@@ -0,0 +1,40 @@
+"""
+Flask JSON provider backed by orjson.
+"""
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    Serialize jsonify responses with orjson. Dates, dataclasses and any
+    type orjson does not know are still handed to Flask's default()
+    hook, and integers beyond 64 bits fall back to json.dumps, so
+    responses contain the same values as before. Known differences:
+    non-ASCII text is emitted as UTF-8 rather than \\u escapes, NaN and
+    Infinity become null, and dicts mixing str and non-str keys are
+    serialized even with sort_keys on.
+
+    Parsing stays with json.loads, which rejects deeply nested request
+    bodies with a catchable RecursionError.
+    """
+
+    # Let Flask's default() format dates and dataclasses as it always has
+    options = (orjson.OPT_NON_STR_KEYS
+               | orjson.OPT_PASSTHROUGH_DATETIME
+               | orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj, falling back to json.dumps where orjson cannot"""
+        # orjson output is always compact, and indent is always 2
+        if kwargs.keys() <= {'indent', 'separators'}:
+            option = self.options
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=self.default, option=option).decode()
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits, which json.dumps supports
+                pass
+        return super().dumps(obj, **kwargs)
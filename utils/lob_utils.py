@@ -5,6 +5,10 @@ import os
 import lob
 from dataclasses import dataclass
 from typing import Dict, List, Any
+from concurrent.futures import ThreadPoolExecutor
+
+# Letters sent to Lob at once by send_batch, well inside its rate limit
+MAX_CONCURRENT_SENDS = 8
 
 class LobAPIError(Exception):
     pass
@@ -73,13 +77,15 @@ class LobClient:
 
     def send_batch(self, addresses: List[Address], html_template: str) -> Dict[str, Any]:
         """
-        Send a batch of letters. This is a naive loop approach for demonstration.
+        Send a batch of letters. Each letter is an independent, network-bound
+        Lob call, so several are in flight at once; results keep input order.
         """
-        results = []
-        for addr in addresses:
+        def send(addr: Address) -> Dict[str, Any]:
             try:
-                res = self.send_letter(addr, html_template)
-                results.append(res)
+                return self.send_letter(addr, html_template)
             except LobAPIError as e:
-                results.append({"error": str(e), "address": addr})
-        return {"results": results}
\ No newline at end of file
+                return {"error": str(e), "address": addr}
+
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_SENDS) as pool:
+            results = list(pool.map(send, addresses))
+        return {"results": results}
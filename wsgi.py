@@ -1,7 +1,11 @@
 """
 WSGI entry point for production deployment.
-Use this file with Gunicorn: gunicorn wsgi:app
+Use this file with Gunicorn: gunicorn --preload wsgi:app
 """
+from dotenv import load_dotenv
+
+load_dotenv()
+
 from app import create_app
 
 app = create_app()